@@ -2,7 +2,40 @@
 Python packaging file for setup tools.
 """
 
+# isort: STDLIB
+import os
+
 # isort: THIRDPARTY
 import setuptools
 
-setuptools.setup()
+_FASTPATHS_PYX = "src/out_of_dbus_python/_fastpaths.pyx"
+_FASTPATHS_C = "src/out_of_dbus_python/_fastpaths.c"
+
+# The _fastpaths extension module is optional; it is built from its Cython
+# source if Cython is available, otherwise from the C source generated from
+# it, which is distributed in the sdist. If neither can be built, the package
+# falls back to pure Python.
+try:
+    # isort: THIRDPARTY
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None  # pylint: disable=invalid-name
+
+if cythonize is not None and os.path.exists(_FASTPATHS_PYX):
+    EXT_MODULES = cythonize(
+        [
+            setuptools.Extension(
+                "out_of_dbus_python._fastpaths", [_FASTPATHS_PYX], optional=True
+            )
+        ]
+    )
+elif os.path.exists(_FASTPATHS_C):
+    EXT_MODULES = [
+        setuptools.Extension(
+            "out_of_dbus_python._fastpaths", [_FASTPATHS_C], optional=True
+        )
+    ]
+else:
+    EXT_MODULES = []
+
+setuptools.setup(ext_modules=EXT_MODULES)
@@ -47,6 +47,8 @@ class OutOfDPUnexpectedValueError(OutOfDPRuntimeError):
     transformation.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, message, value):
         """
         Initializer.
@@ -66,6 +68,8 @@ class OutOfDPSurprisingError(OutOfDPRuntimeError):
     libraries.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, message, value):  # pragma: no cover
         """
         Initializer.
@@ -82,6 +86,8 @@ class OutOfDPSignatureError(OutOfDPError):
     Exception raised when a value does not seem to have a valid signature.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, message, value):
         """
         Initializer.
@@ -0,0 +1,101 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Copyright 2016 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compiled xformer functions for the most common signatures.
+
+This module is optional; it is built only if Cython is available.
+"""
+
+cdef object _xform_variant = None
+
+
+cpdef dict xform_a_sv(object a_dict):
+    """
+    Function for extracting a dict from a Dictionary with signature a{sv}.
+
+    :param a_dict: the dictionary to transform
+    :type a_dict: Dictionary
+    :returns: a dict of transformed values
+    :rtype: dict
+    """
+    cdef dict result = {}
+    for (key, value) in a_dict.items():
+        result[str(key)] = _xform_variant(value)
+    return result
+
+
+cpdef dict xform_a_ss(object a_dict):
+    """
+    Function for extracting a dict from a Dictionary with signature a{ss}.
+
+    :param a_dict: the dictionary to transform
+    :type a_dict: Dictionary
+    :returns: a dict of transformed values
+    :rtype: dict
+    """
+    cdef dict result = {}
+    for (key, value) in a_dict.items():
+        result[str(key)] = str(value)
+    return result
+
+
+cpdef dict xform_a_sa_sv(object a_dict):
+    """
+    Function for extracting a dict from a Dictionary with signature
+    a{sa{sv}}, e.g., the properties of the interfaces of a D-Bus object.
+
+    :param a_dict: the dictionary to transform
+    :type a_dict: Dictionary
+    :returns: a dict of transformed values
+    :rtype: dict
+    """
+    cdef dict result = {}
+    for (key, value) in a_dict.items():
+        result[str(key)] = xform_a_sv(value)
+    return result
+
+
+cpdef dict xform_a_oa_sa_sv(object a_dict):
+    """
+    Function for extracting a dict from a Dictionary with signature
+    a{oa{sa{sv}}}, e.g., the result of GetManagedObjects.
+
+    :param a_dict: the dictionary to transform
+    :type a_dict: Dictionary
+    :returns: a dict of transformed values
+    :rtype: dict
+    """
+    cdef dict result = {}
+    for (key, value) in a_dict.items():
+        result[str(key)] = xform_a_sa_sv(value)
+    return result
+
+
+def fast_paths(xform_variant):
+    """
+    Get the compiled functions, indexed by their signatures.
+
+    :param xform_variant: the function for transforming a variant value
+    :returns: the compiled functions
+    :rtype: dict of str * function
+    """
+    global _xform_variant
+    _xform_variant = xform_variant
+    return {
+        "a{sv}": xform_a_sv,
+        "a{ss}": xform_a_ss,
+        "a{sa{sv}}": xform_a_sa_sv,
+        "a{oa{sa{sv}}}": xform_a_oa_sa_sv,
+    }
@@ -17,6 +17,9 @@ Transforming Python dbus types to Python basic types.
 
 # isort: STDLIB
 import functools
+import itertools
+import sys
+import types
 
 # isort: THIRDPARTY
 import dbus
@@ -31,6 +34,17 @@ from ._errors import (
     OutOfDPUnexpectedValueError,
 )
 
+try:
+    from ._fastpaths import (  # pyright: ignore [ reportMissingImports ]
+        fast_paths as _fast_paths,
+    )
+except ImportError:  # pragma: no cover
+    _fast_paths = None  # pylint: disable=invalid-name
+
+# Bound once, to save looking up the attributes on every check of a value.
+_DBUS_ARRAY = dbus.types.Array  # pylint: disable=invalid-name
+_DBUS_STRUCT = dbus.types.Struct  # pylint: disable=invalid-name
+
 
 def _wrapper(func):
     """
@@ -40,16 +54,15 @@ def _wrapper(func):
     :param func: the transforming function
     """
 
-    @functools.wraps(func)
-    def the_func(expr, *, variant=0):
+    def the_func(expr, *, variant=0):  # pylint: disable=unused-argument
         """
         The actual function.
 
         :param object expr: the expression to be xformed to dbus-python types
-        :param int variant: the variant level of the transformed object
+        :param int variant: the variant level of the transformed object, ignored
         """
         try:
-            return func(expr, variant=variant)
+            return func(expr)
         # Allow KeyboardInterrupt error to be propagated
         except KeyboardInterrupt as err:  # pragma: no cover
             raise err
@@ -64,204 +77,632 @@ def _wrapper(func):
     return the_func
 
 
-class _FromDbusXformer(Parser):
+# The largest number of functions for which _apply_each generates code. A
+# dbus signature is at most 255 characters long, so every struct and argument
+# list with a valid signature is unrolled.
+_MAX_UNROLLED = 255
+
+
+def _apply_each(funcs, kind):
+    """
+    Get a function that applies each function to the corresponding item of
+    a sequence of the same length.
+
+    The calls are unrolled in a generated function, which avoids
+    constructing a zip and iterating over it on every call.
+
+    :param funcs: the functions to apply
+    :type funcs: tuple of function
+    :param str kind: the kind of the result, "list" or "tuple"
+    :returns: a function that applies funcs to a sequence
+    :rtype: (list or tuple) -> (list or tuple)
+    """
+    if len(funcs) > _MAX_UNROLLED:
+        if kind == "list":
+            return lambda seq: [f(x) for (f, x) in zip(funcs, seq)]
+        return lambda seq: tuple(map(lambda f, x: f(x), funcs, seq))
+
+    calls = "".join(f"f{i}(seq[{i}]), " for i in range(len(funcs)))
+    source = f"lambda seq: [{calls}]" if kind == "list" else f"lambda seq: ({calls})"
+    namespace = {f"f{i}": f for (i, f) in enumerate(funcs)}
+    return eval(source, namespace)  # pylint: disable=eval-used # nosec B307
+
+
+def _xform_variant(a_tuple):
+    """
+    Function for generating a variant value from a tuple.
+
+    :param a_tuple: the parts of the variant
+    :type a_tuple: (str * object) or list
+    :returns: a value of the correct type
+    :rtype: object
+    """
+    try:
+        (signature, an_obj) = a_tuple
+        (func, sig) = _parse_variant_sig(signature)
+    # Allow KeyboardInterrupt error to be propagated
+    except KeyboardInterrupt as err:  # pragma: no cover
+        raise err
+    except BaseException as err:
+        raise OutOfDPUnexpectedValueError(
+            "inappropriate argument or signature for variant type", a_tuple
+        ) from err
+    assert sig == signature
+    return func(an_obj)
+
+
+def _fast_asv(a_dict):
+    """
+    Function for extracting a dict from a Dictionary with signature a{sv}.
+
+    :param a_dict: the dictionary to transform
+    :type a_dict: Dictionary
+    :returns: a dict of transformed values
+    :rtype: dict
+    """
+    return {str(x): _xform_variant(y) for (x, y) in a_dict.items()}
+
+
+def _fast_ass(a_dict):
     """
-    Class which extends a Parser to yield a function that yields
-    a function that transforms a value in dbus-python types to a correct value
-    using base Python types.
+    Function for extracting a dict from a Dictionary with signature a{ss}.
+
+    :param a_dict: the dictionary to transform
+    :type a_dict: Dictionary
+    :returns: a dict of transformed values
+    :rtype: dict
     """
+    return {str(x): str(y) for (x, y) in a_dict.items()}
+
+
+def _fast_as(a_list):
+    """
+    Function for generating a list from an Array with signature as.
+
+    :param a_list: the list to transform
+    :type a_list: Array
+    :returns: a list of transformed values
+    :rtype: list
+    """
+    if not isinstance(a_list, _DBUS_ARRAY):
+        raise OutOfDPUnexpectedValueError(
+            "expected an Array but found something else",
+            a_list,
+        )
+    return [str(x) for x in a_list]
 
-    # pylint: disable=too-few-public-methods
 
-    def _handle_variant(self):
+def _fast_ay(a_list):
+    """
+    Function for generating a list from an Array with signature ay.
+
+    :param a_list: the list to transform
+    :type a_list: Array
+    :returns: a list of transformed values
+    :rtype: list
+    """
+    if not isinstance(a_list, _DBUS_ARRAY):
+        raise OutOfDPUnexpectedValueError(
+            "expected an Array but found something else",
+            a_list,
+        )
+    try:
+        return [int(x) for x in a_list]
+    except Exception:  # pylint: disable=broad-except
+        # Use the generic function, which identifies the offending value.
+        func = _BASE_XFORMERS["y"]
+        return [func(x) for x in a_list]
+
+
+# Hand-written functions for the most common complete signatures, which
+# bypass the per-element closures of the generic functions.
+_FAST_PATHS = {
+    "a{sv}": _fast_asv,
+    "a{ss}": _fast_ass,
+    "as": _fast_as,
+    "ay": _fast_ay,
+}
+
+# Compiled functions for some common complete signatures, available only if
+# the optional _fastpaths extension module has been built.
+_COMPILED_PATHS = {} if _fast_paths is None else _fast_paths(_xform_variant)
+_FAST_PATHS.update(_COMPILED_PATHS)
+
+# The signatures produced by _parse are interned; intern the keys, too, so
+# that they are found by identity.
+_FAST_PATHS = {sys.intern(sig): func for (sig, func) in _FAST_PATHS.items()}
+
+
+def _split_signature(sig):
+    """
+    Split a signature into the signatures of its top-level complete types.
+
+    Only the nesting of the brackets is checked; each part must still be
+    parsed to verify that it is a valid complete signature.
+
+    :param str sig: a signature
+    :returns: the signatures of the top-level types or None if unbalanced
+    :rtype: list of str or NoneType
+    """
+    parts = []
+    start = 0
+    index = 0
+    length = len(sig)
+    while index < length:
+        while index < length and sig[index] == "a":
+            index += 1
+
+        if index < length and sig[index] in "({":
+            depth = 0
+            while index < length:
+                if sig[index] in "({":
+                    depth += 1
+                elif sig[index] in ")}":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                index += 1
+
+        if index == length:
+            return None
+
+        index += 1
+        parts.append(sig[start:index])
+        start = index
+
+    return parts
+
+
+# The Python type to which each dbus-python base type is transformed.
+_BASE_TYPES = {
+    "y": int,
+    "b": bool,
+    "n": int,
+    "q": int,
+    "i": int,
+    "u": int,
+    "x": int,
+    "t": int,
+    "d": float,
+    "h": int,
+    "s": str,
+    "o": str,
+    "g": str,
+}
+
+
+def _reject(value):
+    """
+    Reject a value that does not inhabit a signature in generated code.
+
+    :param object value: the value
+    :raises OutOfDPUnexpectedValueError: always
+    """
+    raise OutOfDPUnexpectedValueError(
+        "value does not inhabit the expected signature", value
+    )
+
+
+# The names available to the source generated by _codegen.
+_CODEGEN_GLOBALS = {
+    "_Array": _DBUS_ARRAY,
+    "_Struct": _DBUS_STRUCT,
+    "_compiled": _COMPILED_PATHS,
+    "_reject": _reject,
+    "_xform_variant": _xform_variant,
+    "bool": bool,
+    "float": float,
+    "int": int,
+    "isinstance": isinstance,
+    "len": len,
+    "str": str,
+}
+
+
+# The deepest nesting of containers for which _codegen generates code. Each
+# container nests brackets and scopes in the generated source, which the
+# CPython compiler does not handle beyond some depth; it may even crash. A
+# more deeply nested signature is transformed by the composed functions.
+_MAX_CODEGEN_DEPTH = 8
+
+
+class _CodegenDepthError(Exception):
+    """
+    Raised by _codegen_expr when a signature is nested too deeply to
+    generate code for it. It is never propagated outside this module.
+    """
+
+
+def _codegen_expr(sig, expr, names, depth=0):
+    """
+    Generate the source of an expression that transforms a value.
+
+    :param str sig: a valid complete signature
+    :param str expr: a side-effect free expression denoting the value
+    :param names: an iterator of fresh variable names
+    :param int depth: the number of containers that enclose the value
+    :returns: the source of an expression denoting the transformed value
+    :rtype: str
+    :raises _CodegenDepthError: if containers are nested too deeply
+    """
+    klass = _BASE_TYPES.get(sig)
+    if klass is not None:
+        return f"{klass.__name__}({expr})"
+
+    if sig in _COMPILED_PATHS:
+        return f"_compiled[{sig!r}]({expr})"
+
+    if sig == "v":
+        return f"_xform_variant({expr})"
+
+    if depth == _MAX_CODEGEN_DEPTH:
+        raise _CodegenDepthError("containers are nested too deeply")
+
+    if sig.startswith("a{"):
+        (key, value) = (next(names), next(names))
+        key_expr = _codegen_expr(sig[2], key, names, depth + 1)
+        value_expr = _codegen_expr(sig[3:-1], value, names, depth + 1)
+        return f"{{{key_expr}: {value_expr} for ({key}, {value}) in {expr}.items()}}"
+
+    if sig.startswith("a"):
+        item = next(names)
+        item_expr = _codegen_expr(sig[1:], item, names, depth + 1)
+        return (
+            f"([{item_expr} for {item} in {expr}] "
+            f"if isinstance({expr}, _Array) else _reject({expr}))"
+        )
+
+    parts = _split_signature(sig[1:-1])
+    struct = next(names)
+    fields = "".join(
+        f"{_codegen_expr(part, f'{struct}[{index}]', names, depth + 1)}, "
+        for (index, part) in enumerate(parts)
+    )
+    return (
+        f"(({fields}) "
+        f"if isinstance(({struct} := {expr}), _Struct) "
+        f"and len({struct}) == {len(parts)} "
+        f"else _reject({struct}))"
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _codegen(signature):
+    """
+    Generate and compile a single function that transforms a list of values
+    for a valid signature.
+
+    The generated function is straight-line code, with no calls through the
+    closures generated for each part of the signature. If the values do not
+    inhabit the signature it calls _slow, which must be bound to the
+    equivalent composition of those closures, so that the error raised is
+    the one those functions raise.
+
+    :param str signature: a valid signature, containing no whitespace
+    :returns: code that defines the function _x or None if none is generated
+    :rtype: code or NoneType
+    """
+    parts = _split_signature(signature)
+    names = (f"x{index}" for index in itertools.count())
+    try:
+        items = "".join(
+            f"{_codegen_expr(part, f'o[{index}]', names)}, "
+            for (index, part) in enumerate(parts)
+        )
+    except _CodegenDepthError:
+        return None
+
+    source = (
+        "def _x(o):\n"
+        "    try:\n"
+        f"        if len(o) != {len(parts)}:\n"
+        "            _reject(o)\n"
+        f"        return [{items}]\n"
+        "    except Exception:\n"
+        "        pass\n"
+        "    return _slow(o)\n"
+    )
+    try:
+        return compile(source, f"<xformer:{signature}>", "exec")
+    except (MemoryError, RecursionError, SyntaxError):  # pragma: no cover
+        return None
+
+
+# The functions generated by the handlers below take the values they use
+# from the enclosing scope as default arguments. These are local variables,
+# which are loaded faster than closure variables.
+
+
+def _handle_dict(key_func, value_func):
+    """
+    Generate the correct function for a dict signature.
+
+    :param key_func: the function for the keys
+    :param value_func: the function for the values
+    :returns: function that returns a dict
+    :rtype: Dictionary -> dict
+    """
+
+    def the_dict_func(a_dict, _key_func=key_func, _value_func=value_func):
         """
-        Generate the correct function for a variant signature.
+        Function for extracting a dict from a Dictionary.
 
-        :returns: function that returns an appropriate value
-        :rtype: ((str * object) or list)-> object
+        :param a_dict: the dictionary to transform
+        :type a_dict: Dictionary
+
+        :returns: a dbus dictionary of transformed values
+        :rtype: Dictionary
         """
+        # Mapping over keys and values separately avoids building and
+        # unpacking a tuple for each item.
+        return dict(
+            zip(map(_key_func, a_dict.keys()), map(_value_func, a_dict.values()))
+        )
+
+    return the_dict_func
+
+
+def _handle_array(func):
+    """
+    Generate the correct function for an array signature.
 
-        def the_func(a_tuple, *, variant=0):
-            """
-            Function for generating a variant value from a tuple.
-
-            :param a_tuple: the parts of the variant
-            :type a_tuple: (str * object) or list
-            :param int variant: object's variant index
-            :returns: a value of the correct type
-            :rtype: object
-            """
-            try:
-                (signature, an_obj) = a_tuple
-                (func, sig) = self.COMPLETE.parseString(signature)[0]
-            # Allow KeyboardInterrupt error to be propagated
-            except KeyboardInterrupt as err:  # pragma: no cover
-                raise err
-            except BaseException as err:
-                raise OutOfDPUnexpectedValueError(
-                    "inappropriate argument or signature for variant type", a_tuple
-                ) from err
-            assert sig == signature
-            return func(an_obj, variant=variant + 1)
-
-        return (the_func, "v")
-
-    @staticmethod
-    def _handle_array(toks):
+    :param func: the function for the items
+    :returns: function that returns a list
+    :rtype: Array -> list
+    """
+
+    def the_array_func(a_list, _func=func):
         """
-        Generate the correct function for an array signature.
+        Function for generating an Array from a list.
 
-        :param toks: the list of parsed tokens
-        :returns: function that returns an Array or Dictionary value
-        :rtype: ((or list dict) -> ((or Array Dictionary) * int)) * str
+        :param a_list: the list to transform
+        :type a_list: list of `a
+        :returns: a dbus Array of transformed values
+        :rtype: Array
         """
+        if not isinstance(a_list, _DBUS_ARRAY):
+            raise OutOfDPUnexpectedValueError(
+                "expected an Array but found something else",
+                a_list,
+            )
+        return [_func(x) for x in a_list]
 
-        if len(toks) == 5 and toks[1] == "{" and toks[4] == "}":
-            subtree = toks[2:4]
-            signature = "".join(s for (_, s) in subtree)
-            [key_func, value_func] = [f for (f, _) in subtree]
-
-            def the_dict_func(a_dict, *, _variant=0):
-                """
-                Function for extracting a dict from a Dictionary.
-
-                :param a_dict: the dictionary to transform
-                :type a_dict: Dictionary
-                :param int variant: variant level
-
-                :returns: a dbus dictionary of transformed values
-                :rtype: Dictionary
-                """
-                return {key_func(x): value_func(y) for (x, y) in a_dict.items()}
-
-            return (the_dict_func, "a{" + signature + "}")
-
-        if len(toks) == 2:
-            (func, sig) = toks[1]
-
-            def the_array_func(a_list, *, _variant=0):
-                """
-                Function for generating an Array from a list.
-
-                :param a_list: the list to transform
-                :type a_list: list of `a
-                :param int variant: variant level of the value
-                :returns: a dbus Array of transformed values
-                :rtype: Array
-                """
-                if not isinstance(a_list, dbus.types.Array):
-                    raise OutOfDPUnexpectedValueError(
-                        f"expected an Array but found something else: {a_list}",
-                        a_list,
-                    )
-                return [func(x) for x in a_list]
-
-            return (the_array_func, "a" + sig)
-
-        # This should be impossible, because a parser error is raised on
-        # an unexpected token before the handler is invoked.
-        raise OutOfDPImpossibleTokenError(
-            "Encountered unexpected tokens in the token stream"
-        )  # pragma: no cover
+    def the_array_map_func(a_list, _func=func):
+        """
+        Function for generating an Array from a list by mapping a function
+        that is not implemented in Python over it.
 
-    @staticmethod
-    def _handle_struct(toks):
+        :param a_list: the list to transform
+        :type a_list: list of `a
+        :returns: a dbus Array of transformed values
+        :rtype: Array
         """
-        Generate the correct function for a struct signature.
+        if not isinstance(a_list, _DBUS_ARRAY):
+            raise OutOfDPUnexpectedValueError(
+                "expected an Array but found something else",
+                a_list,
+            )
+        return list(map(_func, a_list))
+
+    # map calls a function that is not implemented in Python, e.g., a type
+    # or a compiled function, without any bytecode for each item; for a
+    # Python function it is no faster than the comprehension.
+    if isinstance(func, types.FunctionType):
+        return the_array_func
+    return the_array_map_func
+
+
+def _handle_struct(funcs):
+    """
+    Generate the correct function for a struct signature.
 
-        :param toks: the list of parsed tokens
-        :returns: function that returns an Array or Dictionary value
-        :rtype: ((list or tuple) -> (Struct * int)) * str
+    :param funcs: the functions for the fields
+    :type funcs: list of function
+    :returns: function that returns a tuple
+    :rtype: Struct -> tuple
+    """
+    funcs = tuple(funcs)
+    num_funcs = len(funcs)
+    apply_funcs = _apply_each(funcs, "tuple")
+
+    def the_func(a_struct, _apply_funcs=apply_funcs, _num_funcs=num_funcs):
         """
-        subtrees = toks[1:-1]
-        signature = "".join(s for (_, s) in subtrees)
-        funcs = [f for (f, _) in subtrees]
-
-        def the_func(a_struct, *, _variant=0):
-            """
-            Function for generating a tuple from a struct.
-
-            :param a_struct: the struct to transform
-            :type a_struct: Struct
-            :param int variant: variant index
-            :returns: a dbus Struct of transformed values
-            :rtype: tuple
-            :raises OutOfDPRuntimeError:
-            """
-            if not isinstance(a_struct, dbus.types.Struct):
-                raise OutOfDPUnexpectedValueError(
-                    f"expected a simple sequence for the fields of a struct "
-                    f"but found something else: {a_struct}",
-                    a_struct,
-                )
-            if len(a_struct) != len(funcs):
-                raise OutOfDPUnexpectedValueError(
-                    f"expected {len(funcs)} elements for a struct, "
-                    f"but found {len(a_struct)}",
-                    a_struct,
-                )
-            return tuple(f(x) for (f, x) in zip(funcs, a_struct))
-
-        return (the_func, "(" + signature + ")")
-
-    @staticmethod
-    def _handle_base_case(klass, symbol):
+        Function for generating a tuple from a struct.
+
+        :param a_struct: the struct to transform
+        :type a_struct: Struct
+        :returns: a dbus Struct of transformed values
+        :rtype: tuple
+        :raises OutOfDPRuntimeError:
         """
-        Handle a base case.
+        if not isinstance(a_struct, _DBUS_STRUCT):
+            raise OutOfDPUnexpectedValueError(
+                "expected a simple sequence for the fields of a struct "
+                "but found something else",
+                a_struct,
+            )
+        if len(a_struct) != _num_funcs:
+            raise OutOfDPUnexpectedValueError(
+                f"expected {_num_funcs} elements for a struct, "
+                f"but found {len(a_struct)}",
+                a_struct,
+            )
+        return _apply_funcs(a_struct)
+
+    return the_func
+
+
+# The base case functions do not check whether a value's type is already
+# klass, to return it unchanged. The constructors int, float, bool and str
+# already return such a value itself, and dbus-python values, which are
+# subclasses, would pay for the check on every call.
+
 
-        :param type klass: the class constructor
-        :param str symbol: the type code
+def _handle_base_case(klass):
+    """
+    Handle a base case.
+
+    :param type klass: the class constructor
+    """
+
+    def the_func(value, _klass=klass):
         """
+        Base case.
 
-        def the_func(value, *, _variant=0):
-            """
-            Base case.
-
-            :param int variant: variant level for this object
-            :returns: a translated Python object
-            :rtype: Python object
-            """
-            try:
-                return klass(value)
-            # Allow KeyboardInterrupt error to be propagated
-            except KeyboardInterrupt as err:  # pragma: no cover
-                raise err
-            except BaseException as err:
-                raise OutOfDPUnexpectedValueError(
-                    "inappropriate value passed to dbus-python constructor", value
-                ) from err
-
-        return lambda: (the_func, symbol)
-
-    def __init__(self):
-        super().__init__()
-
-        self.BYTE.setParseAction(_FromDbusXformer._handle_base_case(int, "y"))
-        self.BOOLEAN.setParseAction(_FromDbusXformer._handle_base_case(bool, "b"))
-        self.INT16.setParseAction(_FromDbusXformer._handle_base_case(int, "n"))
-        self.UINT16.setParseAction(_FromDbusXformer._handle_base_case(int, "q"))
-        self.INT32.setParseAction(_FromDbusXformer._handle_base_case(int, "i"))
-        self.UINT32.setParseAction(_FromDbusXformer._handle_base_case(int, "u"))
-        self.INT64.setParseAction(_FromDbusXformer._handle_base_case(int, "x"))
-        self.UINT64.setParseAction(_FromDbusXformer._handle_base_case(int, "t"))
-        self.DOUBLE.setParseAction(_FromDbusXformer._handle_base_case(float, "d"))
-        self.UNIX_FD.setParseAction(_FromDbusXformer._handle_base_case(int, "h"))
-        self.STRING.setParseAction(_FromDbusXformer._handle_base_case(str, "s"))
-        self.OBJECT_PATH.setParseAction(_FromDbusXformer._handle_base_case(str, "o"))
-        self.SIGNATURE.setParseAction(_FromDbusXformer._handle_base_case(str, "g"))
-
-        self.VARIANT.setParseAction(self._handle_variant)
-
-        self.ARRAY.setParseAction(  # pyright: ignore [ reportOptionalMemberAccess ]
-            _FromDbusXformer._handle_array
-        )
+        :returns: a translated Python object
+        :rtype: Python object
+        """
+        try:
+            return _klass(value)
+        # Allow KeyboardInterrupt error to be propagated
+        except KeyboardInterrupt as err:  # pragma: no cover
+            raise err
+        except BaseException as err:
+            raise OutOfDPUnexpectedValueError(
+                "inappropriate value passed to dbus-python constructor", value
+            ) from err
 
-        self.STRUCT.setParseAction(  # pyright: ignore [ reportOptionalMemberAccess ]
-            _FromDbusXformer._handle_struct
-        )
+    return the_func
+
+
+# The function for each base type code; these are the type codes permitted
+# for dict keys. The bool and str constructors accept any value of the
+# corresponding dbus-python types, so that no exception need be handled, and
+# the constructor itself is the function.
+_BASE_XFORMERS = {
+    code: klass if klass in (bool, str) else _handle_base_case(klass)
+    for (code, klass) in _BASE_TYPES.items()
+}
 
+# The function for each type code that is a complete signature by itself,
+# i.e., each base type and variant.
+_CODE_XFORMERS = dict(_BASE_XFORMERS, v=_xform_variant)
 
-_XFORMER = _FromDbusXformer()
+
+class _SignatureParseError(Exception):
+    """
+    Raised by _parse when a signature is not valid. It is never propagated
+    outside this module.
+    """
+
+
+def _parse(sig, index):
+    """
+    Parse the complete signature that starts at index in a signature.
+
+    The grammar is that of dbus_signature_pyparsing.Parser, except that no
+    whitespace is permitted and that the key of a dict entry must be a basic
+    type, as the D-Bus specification requires.
+
+    :param str sig: a signature
+    :param int index: the index at which the complete signature starts
+    :returns: the function, its signature and the index following it
+    :rtype: function * str * int
+    :raises _SignatureParseError: if there is no complete signature at index
+    """
+    code = sig[index : index + 1]
+    func = _CODE_XFORMERS.get(code)
+
+    if func is not None:
+        end = index + 1
+
+    elif code == "a" and sig[index + 1 : index + 2] == "{":
+        key_func = _BASE_XFORMERS.get(sig[index + 2 : index + 3])
+        if key_func is None:
+            raise _SignatureParseError("expected a basic type code for a dict key")
+        (value_func, _, end) = _parse(sig, index + 3)
+        if sig[end : end + 1] != "}":
+            raise _SignatureParseError("expected } to end a dict entry")
+        (func, end) = (_handle_dict(key_func, value_func), end + 1)
+
+    elif code == "a":
+        (item_func, _, end) = _parse(sig, index + 1)
+        func = _handle_array(item_func)
+
+    elif code == "(":
+        funcs = []
+        end = index + 1
+        while sig[end : end + 1] != ")":
+            (field_func, _, end) = _parse(sig, end)
+            funcs.append(field_func)
+        if not funcs:
+            raise _SignatureParseError("expected at least one field in a struct")
+        (func, end) = (_handle_struct(funcs), end + 1)
+
+    else:
+        raise _SignatureParseError("expected a complete signature")
+
+    signature = sys.intern(sig[index:end])
+    return (_FAST_PATHS.get(signature, func), signature, end)
+
+
+def _parse_all(sig):
+    """
+    Parse a signature.
+
+    :param str sig: a signature
+    :returns: the functions for the complete signatures in the signature
+    :rtype: tuple of tuple of a function * str
+    :raises _SignatureParseError: if the signature is not valid
+    """
+    result = []
+    index = 0
+    while index < len(sig):
+        (func, signature, index) = _parse(sig, index)
+        result.append((func, signature))
+    return tuple(result)
+
+
+# Used only to report errors in signatures that _parse rejects. Its grammar
+# permits a variant as the key of a dict entry, but the D-Bus specification
+# permits only a basic type.
+_PARSER = Parser()
+_PARSER.DICT_ENTRY.addCondition(
+    lambda toks: toks[1] != "v", message="expected a basic type code for a dict key"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_variant_sig(signature):
+    """
+    Get the xformer function for the complete signature of a variant's value.
+
+    Parsing a signature is pure, so the result is cached.
+
+    :param str signature: a complete signature
+    :returns: the xformer function and its signature
+    :rtype: tuple of a function * str
+    """
+    (func, sig, _) = _parse(signature, 0)
+    return (func, sig)
+
+
+@functools.lru_cache(maxsize=512)
+def _xformers(sig):
+    """
+    Get the tuple of xformer functions for the given signature.
+
+    Parsing a signature is pure, so the result is cached.
+
+    :param str sig: a signature
+    :returns: a tuple of xformer functions for the given signature.
+    :rtype: tuple of tuple of a function * str
+    """
+    try:
+        return _parse_all(sig)
+    except _SignatureParseError:
+        pass
+
+    # The pyparsing parser raises the customary exception if the signature
+    # is not valid. Otherwise, the signature contains whitespace, which the
+    # pyparsing parser skips, but _parse does not.
+    tokens = _PARSER.PARSER.parseString(sig, parseAll=True)
+    try:
+        return _parse_all("".join(tokens))
+    except _SignatureParseError as err:  # pragma: no cover
+        raise OutOfDPImpossibleTokenError(
+            "Encountered unexpected tokens in the token stream"
+        ) from err
 
 
 def xformers(sig):
@@ -272,9 +713,7 @@ def xformers(sig):
     :returns: a list of xformer functions for the given signature.
     :rtype: list of tuple of a function * str
     """
-    return [
-        (_wrapper(f), l) for (f, l) in _XFORMER.PARSER.parseString(sig, parseAll=True)
-    ]
+    return [(_wrapper(f), l) for (f, l) in _xformers(sig)]
 
 
 def xformer(signature):
@@ -286,7 +725,10 @@ def xformer(signature):
     :rtype: (list of object) -> (list of object)
     """
 
-    funcs = [f for (f, _) in xformers(signature)]
+    parsed = _xformers(signature)
+    funcs = tuple(f for (f, _) in parsed)
+    num_funcs = len(funcs)
+    apply_funcs = _apply_each(funcs, "list")
 
     def the_func(objects):
         """
@@ -298,11 +740,20 @@ def xformer(signature):
         :returns: transformed objects
         :rtype: list of object (in dbus types)
         """
-        if len(objects) != len(funcs):
+        if len(objects) != num_funcs:
             raise OutOfDPUnexpectedValueError(
-                f"expected {len(funcs)} items to transform but found {len(objects)}",
+                f"expected {num_funcs} items to transform but found {len(objects)}",
                 objects,
             )
-        return [f(a) for (f, a) in zip(funcs, objects)]
+        return apply_funcs(objects)
 
-    return the_func
+    # The signatures of the parts contain no whitespace, unlike signature.
+    code = _codegen("".join(s for (_, s) in parsed))
+    if code is None:
+        return _wrapper(the_func)
+
+    namespace = dict(_CODEGEN_GLOBALS, _slow=the_func)
+    exec(code, namespace)  # pylint: disable=exec-used # nosec B102
+
+    # Guard the whole transformation once, rather than each of its parts.
+    return _wrapper(namespace["_x"])
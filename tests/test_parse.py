@@ -0,0 +1,90 @@
+# Copyright 2016 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test parsing signatures.
+"""
+
+# isort: STDLIB
+import itertools
+import re
+import unittest
+
+# isort: THIRDPARTY
+from pyparsing import ParseException
+
+# isort: FIRSTPARTY
+from dbus_signature_pyparsing import Parser
+
+# isort: LOCAL
+from out_of_dbus_python import xformers
+
+# A signature in which a variant is the key of a dict entry; the grammar of
+# Parser accepts it, but the D-Bus specification does not.
+_VARIANT_KEY = re.compile(r"{\s*v")
+
+
+class ParseTestCase(unittest.TestCase):
+    """
+    Test the signatures accepted by xformers.
+    """
+
+    def test_parts(self):
+        """
+        Test the signatures of the parts of some signatures.
+        """
+        for signature, parts in [
+            ("", []),
+            ("s", ["s"]),
+            ("si", ["s", "i"]),
+            ("a{sv}u", ["a{sv}", "u"]),
+            ("aa{sa(ii)}(sv)ay", ["aa{sa(ii)}", "(sv)", "ay"]),
+            ("a{oa{sa{sv}}}", ["a{oa{sa{sv}}}"]),
+            ("s i", ["s", "i"]),
+            (" a {s v} ", ["a{sv}"]),
+            ("( s i )a {s (i)}", ["(si)", "a{s(i)}"]),
+        ]:
+            with self.subTest(signature=signature):
+                self.assertEqual([s for (_, s) in xformers(signature)], parts)
+
+    def test_invalid(self):
+        """
+        Test some invalid signatures.
+        """
+        for signature in ["a", "(", ")", "()", "{ss}", "a{s}", "a{svs}", "a{sv", "z"]:
+            with self.subTest(signature=signature):
+                with self.assertRaises(ParseException):
+                    xformers(signature)
+
+    def test_parser(self):
+        """
+        Test that every short signature is accepted if and only if Parser
+        accepts it, except that a variant key is rejected.
+        """
+        parser = Parser().PARSER
+        for length in range(5):
+            for chars in itertools.product("a(){}siv ", repeat=length):
+                signature = "".join(chars)
+                with self.subTest(signature=signature):
+                    try:
+                        tokens = parser.parseString(signature, parseAll=True)
+                    except ParseException:
+                        tokens = None
+                    if tokens is None or _VARIANT_KEY.search(signature):
+                        with self.assertRaises(ParseException):
+                            xformers(signature)
+                    else:
+                        self.assertEqual(
+                            "".join(s for (_, s) in xformers(signature)),
+                            "".join(tokens),
+                        )
@@ -0,0 +1,303 @@
+# Copyright 2016 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Test transforming dbus-python values with xformer.
+"""
+
+# isort: STDLIB
+import unittest
+from unittest import mock
+
+# isort: THIRDPARTY
+import dbus
+from pyparsing import ParseException
+
+# isort: LOCAL
+from out_of_dbus_python import xformer, xformers
+from out_of_dbus_python._errors import OutOfDPUnexpectedValueError
+from out_of_dbus_python import _xformer
+from out_of_dbus_python._xformer import (
+    _CODEGEN_GLOBALS,
+    _FAST_PATHS,
+    _MAX_CODEGEN_DEPTH,
+    _codegen,
+    _parse,
+)
+
+# Values, some of which inhabit and some of which do not inhabit the
+# signatures that are tested.
+_VALUES = [
+    1,
+    None,
+    "x",
+    [1],
+    dbus.Byte(1),
+    dbus.Int32(-1),
+    dbus.Double(1.5),
+    dbus.Boolean(1),
+    dbus.String("x"),
+    dbus.Array([]),
+    dbus.Array([dbus.Byte(1), dbus.Byte(2)]),
+    dbus.Array([dbus.String("x")]),
+    dbus.Array(["x"]),
+    dbus.Array([None]),
+    dbus.Array([dbus.Array([dbus.Double(1.0)])]),
+    dbus.Array([dbus.Struct([dbus.String("x"), dbus.Int32(1)])]),
+    dbus.Struct([dbus.Int32(1), dbus.Int32(2)]),
+    dbus.Struct([dbus.Int32(1)]),
+    dbus.Struct([dbus.Byte(1), ("s", dbus.String("x"))]),
+    dbus.Struct([dbus.String("x"), dbus.Dictionary({"k": dbus.String("v")})]),
+    dbus.Dictionary({}),
+    dbus.Dictionary({dbus.String("k"): ("s", dbus.String("x"))}),
+    dbus.Dictionary({dbus.String("k"): ("ay", dbus.Array([dbus.Byte(1)]))}),
+    dbus.Dictionary({dbus.String("k"): ("q", dbus.String("x"))}),
+    dbus.Dictionary({dbus.String("k"): ("a{vs}", dbus.Dictionary({}))}),
+    dbus.Dictionary({dbus.String("k"): dbus.String("x")}),
+    dbus.Dictionary({dbus.String("k"): None}),
+    dbus.Dictionary({dbus.String("k"): dbus.Struct([dbus.Int32(1), dbus.Boolean(0)])}),
+    dbus.Dictionary(
+        {
+            dbus.ObjectPath("/o"): dbus.Dictionary(
+                {
+                    dbus.String("i"): dbus.Dictionary(
+                        {dbus.String("p"): ("u", dbus.UInt32(1))}
+                    )
+                }
+            )
+        }
+    ),
+]
+
+
+def _outcome(func, value):
+    """
+    Get the outcome of applying a function to a value.
+
+    :param func: the function
+    :param object value: the value
+    :returns: the result or the type and value of the error raised
+    :rtype: object
+    """
+    try:
+        return func(value)
+    except Exception as err:  # pylint: disable=broad-except
+        return (type(err), getattr(err, "value", None))
+
+
+# The deepest nesting of arrays, and likewise of structs, that the D-Bus
+# specification permits in a signature.
+_MAX_NESTING = 32
+
+
+def _nest(depth, value, klass):
+    """
+    Nest a value in containers.
+
+    :param int depth: the number of containers
+    :param object value: the innermost value
+    :param type klass: the container class, called on a list of one item
+    :returns: the nested value
+    :rtype: object
+    """
+    for _ in range(depth):
+        value = klass([value])
+    return value
+
+
+class DeepNestingTestCase(unittest.TestCase):
+    """
+    Test signatures with the deepest nesting of containers permitted.
+    """
+
+    def test_arrays(self):
+        """
+        Test an array nested in arrays.
+        """
+        func = xformer("a" * _MAX_NESTING + "y")
+        value = _nest(_MAX_NESTING, dbus.Byte(7), dbus.Array)
+        self.assertEqual(func([value]), [_nest(_MAX_NESTING, 7, list)])
+
+    def test_structs(self):
+        """
+        Test a struct nested in structs.
+        """
+        func = xformer("(" * _MAX_NESTING + "y" + ")" * _MAX_NESTING)
+        value = _nest(_MAX_NESTING, dbus.Byte(7), dbus.Struct)
+        self.assertEqual(func([value]), [_nest(_MAX_NESTING, 7, tuple)])
+
+    def test_dicts(self):
+        """
+        Test arrays nested in the value of a dict.
+        """
+        func = xformer("a{s" + "a" * (_MAX_NESTING - 1) + "y}")
+        value = _nest(_MAX_NESTING - 1, dbus.Byte(7), dbus.Array)
+        self.assertEqual(
+            func([dbus.Dictionary({dbus.String("k"): value})]),
+            [{"k": _nest(_MAX_NESTING - 1, 7, list)}],
+        )
+
+    def test_arrays_and_structs(self):
+        """
+        Test arrays and structs, nested alternately.
+        """
+        func = xformer("(a" * _MAX_NESTING + "y" + ")" * _MAX_NESTING)
+        (value, expected) = (dbus.Byte(7), 7)
+        for _ in range(_MAX_NESTING):
+            value = dbus.Struct([dbus.Array([value])])
+            expected = ([expected],)
+        self.assertEqual(func([value]), [expected])
+
+    def test_bad_value(self):
+        """
+        Test that a value that does not inhabit a deep signature is rejected.
+        """
+        func = xformer("a" * _MAX_NESTING + "y")
+        value = _nest(_MAX_NESTING - 1, dbus.Byte(7), dbus.Array)
+        with self.assertRaises(OutOfDPUnexpectedValueError):
+            func([value])
+
+
+class ErrorTestCase(unittest.TestCase):
+    """
+    Test the errors raised for values that do not inhabit a signature.
+    """
+
+    def test_no_context(self):
+        """
+        Test that an error is not raised while handling an internal one.
+        """
+        for signature, objects in [
+            ("(ii)", [1]),
+            ("(ii)", [dbus.Struct([dbus.Int32(1)])]),
+            ("ai", [dbus.Struct([dbus.Int32(1)])]),
+        ]:
+            with self.subTest(signature=signature, objects=objects):
+                with self.assertRaises(OutOfDPUnexpectedValueError) as context:
+                    xformer(signature)(objects)
+                self.assertIsNone(context.exception.__context__)
+
+
+class GeneratedCodeTestCase(unittest.TestCase):
+    """
+    Test the code generated for xformer.
+    """
+
+    def _xform(self, signature, objects):
+        """
+        Transform objects with the code generated for a signature only.
+
+        :param str signature: a signature, containing no whitespace
+        :param objects: the objects to transform
+        :type objects: list of object
+        :returns: the transformed objects
+        :rtype: list of object
+        """
+
+        def slow(objects):
+            self.fail(f"generated code for {signature} rejected {objects}")
+
+        namespace = dict(_CODEGEN_GLOBALS, _slow=slow)
+        exec(_codegen(signature), namespace)  # pylint: disable=exec-used # nosec B102
+        return namespace["_x"](objects)
+
+    def test_slow(self):
+        """
+        Test that the generated code transforms values as the composed
+        functions do, and raises the same errors.
+        """
+        for signature in [
+            "(ii)",
+            "a(si)",
+            "a{sv}u",
+            "a{oa{sa{sv}}}",
+            "ay",
+            "(yv)",
+            "a{s(ib)}",
+            "aad",
+            "(sa{ss})",
+        ]:
+            func = xformer(signature)
+            with mock.patch.object(_xformer, "_codegen", return_value=None):
+                slow = xformer(signature)
+            num_parts = len(xformers(signature))
+            for objects in [[]] + [[value] * num_parts for value in _VALUES]:
+                with self.subTest(signature=signature, objects=objects):
+                    self.assertEqual(_outcome(func, objects), _outcome(slow, objects))
+
+    def test_depth(self):
+        """
+        Test that no code is generated for a deeply nested signature.
+        """
+        self.assertIsNotNone(_codegen("a" * _MAX_CODEGEN_DEPTH + "y"))
+        self.assertIsNone(_codegen("a" * (_MAX_CODEGEN_DEPTH + 1) + "y"))
+        self.assertIsNone(
+            _codegen("(" * (_MAX_CODEGEN_DEPTH + 1) + "y)" + ")" * _MAX_CODEGEN_DEPTH)
+        )
+
+    def test_nested_structs(self):
+        """
+        Test structs in structs and in arrays.
+        """
+        self.assertEqual(
+            self._xform(
+                "((ii)(ii))a(s(y))",
+                [
+                    dbus.Struct(
+                        [
+                            dbus.Struct([dbus.Int32(1), dbus.Int32(2)]),
+                            dbus.Struct([dbus.Int32(3), dbus.Int32(4)]),
+                        ]
+                    ),
+                    dbus.Array(
+                        [dbus.Struct([dbus.String("a"), dbus.Struct([dbus.Byte(5)])])]
+                    ),
+                ],
+            ),
+            [((1, 2), (3, 4)), [("a", (5,))]],
+        )
+
+
+class SignatureTestCase(unittest.TestCase):
+    """
+    Test the signatures accepted and rejected by xformers and xformer.
+    """
+
+    def test_variant_key(self):
+        """
+        Test that a variant is rejected as the key of a dict entry.
+        """
+        for signature in ["a{vs}", "a{ v s }", "(a{sa{vs}})"]:
+            with self.subTest(signature=signature):
+                with self.assertRaises(ParseException):
+                    xformers(signature)
+                with self.assertRaises(ParseException):
+                    xformer(signature)
+
+
+class FastPathTestCase(unittest.TestCase):
+    """
+    Test the hand-written and compiled functions for common signatures.
+    """
+
+    def test_generic(self):
+        """
+        Test that each function transforms values as the generic function
+        does, and raises the same errors.
+        """
+        for signature, func in list(_FAST_PATHS.items()):
+            with mock.patch.dict(_FAST_PATHS, clear=True):
+                (generic, _, _) = _parse(signature, 0)
+            for value in _VALUES:
+                with self.subTest(signature=signature, value=value):
+                    self.assertEqual(_outcome(func, value), _outcome(generic, value))